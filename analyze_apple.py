@@ -0,0 +1,27 @@
+#!/usr/bin/env python3
+"""
+Run both Apple account analyzers against a single shared client.
+"""
+
+import asyncio
+
+from analyze_apple_accounts import analyze_apple_accounts, cached_get_accounts, get_client
+from analyze_apple_transactions import analyze_apple_transactions
+
+async def run_all():
+    """Run the account and transaction analyzers with one client and one accounts fetch."""
+    mm = get_client()
+    if mm is None:
+        return None
+
+    # Fetch accounts once and hand the same client + payload to both
+    # analyzers so the combined run pays for a single TLS handshake and a
+    # single account-discovery round-trip.
+    accounts = await cached_get_accounts(mm)
+    return await asyncio.gather(
+        analyze_apple_accounts(mm, accounts),
+        analyze_apple_transactions(mm, accounts),
+    )
+
+if __name__ == "__main__":
+    asyncio.run(run_all())
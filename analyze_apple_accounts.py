@@ -4,16 +4,78 @@ Analyze Apple financial accounts in Monarch Money.
 """
 
 import asyncio
-import json
+import hashlib
 import os
+import re
+import time
+from pathlib import Path
 from typing import Dict, List, Any
 
-from monarchmoney import MonarchMoney
+import orjson
 
-APPLE_PROVIDERS = ["Apple Card", "Apple Cash", "Apple Savings"]
+from monarchmoney import MonarchMoney
 
-async def analyze_apple_accounts():
-    """Analyze Apple financial accounts and their balances."""
+ACCOUNTS_CACHE_TEMPLATE = ".mm/accounts_cache_{}.json"
+ACCOUNTS_CACHE_TTL_SECONDS = 900
+
+def _accounts_cache_path(token: str) -> Path:
+    """
+    Returns the cache file for the given token. The file is keyed on a
+    hash of the token — so the token itself never lands on disk — and
+    switching MONARCH_TOKEN within the TTL misses instead of serving the
+    previous account's data.
+    """
+    digest = hashlib.sha256((token or '').encode()).hexdigest()[:12]
+    return Path(ACCOUNTS_CACHE_TEMPLATE.format(digest))
+
+async def cached_get_accounts(mm: MonarchMoney, ttl_seconds: int = ACCOUNTS_CACHE_TTL_SECONDS) -> Dict[str, Any]:
+    """
+    Fetch accounts, reusing a recent on-disk copy when one is fresh enough.
+
+    Account data changes on the order of hours, so back-to-back analyzer
+    runs within the TTL skip the round-trip entirely. The cache is keyed
+    on the client's token and written atomically via os.replace so a
+    crashed run never leaves a torn file.
+    """
+    cache_path = _accounts_cache_path(mm.token)
+    # A single stat (instead of exists() + stat()) covers both the
+    # missing-file and freshness checks; comparing raw epoch seconds avoids
+    # building datetime/timedelta objects just for an age test.
+    try:
+        mtime = os.stat(cache_path).st_mtime
+    except FileNotFoundError:
+        mtime = None
+    if mtime is not None and time.time() - mtime < ttl_seconds:
+        return orjson.loads(cache_path.read_bytes())
+
+    accounts = await mm.get_accounts()
+    cache_path.parent.mkdir(exist_ok=True)
+    tmp_path = cache_path.with_suffix(".json.tmp")
+    tmp_path.write_bytes(orjson.dumps(accounts))
+    os.replace(tmp_path, cache_path)
+    return accounts
+
+# Matches the Apple data providers: Apple Card, Apple Cash, Apple Savings.
+_APPLE_RE = re.compile(r"Apple (Card|Cash|Savings)")
+
+def find_apple_accounts(accounts: Dict[str, Any]) -> List[Dict[str, Any]]:
+    """
+    Filter a get_accounts() response down to Apple financial accounts.
+
+    The result is memoized on the payload so analyzers sharing the same
+    accounts dict only scan it once.
+    """
+    apple_accounts = accounts.get('_apple_accounts')
+    if apple_accounts is None:
+        apple_accounts = [
+            account for account in accounts.get('accounts', ())
+            if _APPLE_RE.search((account.get('institution') or {}).get('name') or '')
+        ]
+        accounts['_apple_accounts'] = apple_accounts
+    return apple_accounts
+
+def get_client() -> MonarchMoney:
+    """Build a MonarchMoney client from the MONARCH_TOKEN environment variable."""
     token = os.getenv('MONARCH_TOKEN')
 
     if not token:
@@ -27,17 +89,29 @@ async def analyze_apple_accounts():
         print("\nThen set it with: export MONARCH_TOKEN='your_token_here'")
         return None
 
-    mm = MonarchMoney(token=token)
+    return MonarchMoney(token=token)
+
+async def analyze_apple_accounts(mm: MonarchMoney = None, accounts: Dict[str, Any] = None):
+    """
+    Analyze Apple financial accounts and their balances.
+
+    Args:
+        mm: An already-authenticated client to reuse; created from
+            MONARCH_TOKEN when omitted.
+        accounts: A pre-fetched get_accounts() response to reuse; fetched
+            when omitted.
+    """
+    if mm is None:
+        mm = get_client()
+        if mm is None:
+            return None
 
     try:
         print("\n🔄 Analyzing Apple accounts...")
-        accounts = await mm.get_accounts()
+        if accounts is None:
+            accounts = await cached_get_accounts(mm)
 
-        apple_accounts = []
-        for account in accounts.get('accounts', []):
-            institution = account.get('institution', {}).get('name', '')
-            if any(provider in institution for provider in APPLE_PROVIDERS):
-                apple_accounts.append(account)
+        apple_accounts = find_apple_accounts(accounts)
 
         if not apple_accounts:
             print("\n❌ No Apple financial accounts found.")
@@ -47,35 +121,41 @@ async def analyze_apple_accounts():
 
         total_balance = 0
 
+        # Every export lands in the same directory; create it once.
+        os.makedirs("data/exports", exist_ok=True)
+
         print("\n" + "="*60)
         for account in apple_accounts:
-            balance = account.get('currentBalance', 0)
-            if balance is None:
-                balance = 0
+            # Bind the repeated .get chains once per account; the locals are
+            # reused by both the print block and the saved export.
+            account_id = account.get('id')
+            name = account.get('displayName', 'Unknown')
+            account_type = account.get('type') or {}
+            inst_name = (account.get('institution') or {}).get('name', 'Unknown')
+            last_updated = account.get('displayLastUpdatedAt')
+            balance = account.get('currentBalance') or 0
 
             total_balance += balance
 
-            print(f"\n📊 {account.get('displayName', 'Unknown')}")
-            print(f"   Type: {account.get('type', {}).get('display', 'Unknown')}")
+            print(f"\n📊 {name}")
+            print(f"   Type: {account_type.get('display', 'Unknown')}")
             print(f"   Balance: ${balance:,.2f}")
-            print(f"   Institution: {account.get('institution', {}).get('name', 'Unknown')}")
-            print(f"   Last Updated: {account.get('displayLastUpdatedAt', 'Unknown')}")
-            print(f"   Account ID: {account.get('id', 'Unknown')}")
+            print(f"   Institution: {inst_name}")
+            print(f"   Last Updated: {last_updated or 'Unknown'}")
+            print(f"   Account ID: {account_id or 'Unknown'}")
 
             # Save account data
             account_data = {
-                'id': account.get('id'),
-                'name': account.get('displayName'),
-                'type': account.get('type', {}).get('name'),
+                'id': account_id,
+                'name': name,
+                'type': account_type.get('name'),
                 'balance': balance,
-                'institution': account.get('institution', {}).get('name'),
-                'last_updated': account.get('displayLastUpdatedAt'),
+                'institution': inst_name,
+                'last_updated': last_updated,
             }
 
-            filename = f"data/exports/{account.get('displayName', 'Unknown').replace(' ', '_')}.json"
-            os.makedirs(os.path.dirname(filename), exist_ok=True)
-            with open(filename, 'w') as f:
-                json.dump(account_data, f, indent=2)
+            filename = f"data/exports/{name.replace(' ', '_')}.json"
+            Path(filename).write_bytes(orjson.dumps(account_data, option=orjson.OPT_INDENT_2))
             print(f"   Data saved to: {filename}")
 
         print("\n" + "="*60)
@@ -4,47 +4,51 @@ Analyze transactions from Apple financial accounts.
 """
 
 import asyncio
-import json
+import heapq
 import os
+from pathlib import Path
+from collections import defaultdict
 from datetime import datetime, timedelta
 from typing import Dict, List, Any
 
+import orjson
+
 from monarchmoney import MonarchMoney
 
-APPLE_PROVIDERS = ["Apple Card", "Apple Cash", "Apple Savings"]
+from analyze_apple_accounts import cached_get_accounts, find_apple_accounts, get_client
+
+def _write_export(meta_filename: str, transaction_meta: Dict[str, Any],
+                  jsonl_filename: str, transaction_list: List[Dict[str, Any]]) -> None:
+    """Write one account's meta + JSONL export (blocking; run in a thread)."""
+    Path(meta_filename).write_bytes(orjson.dumps(transaction_meta))
+    with open(jsonl_filename, 'wb') as f:
+        for transaction in transaction_list:
+            f.write(orjson.dumps(transaction))
+            f.write(b"\n")
 
-async def analyze_apple_transactions(days: int = 30):
+async def analyze_apple_transactions(mm: MonarchMoney = None, accounts: Dict[str, Any] = None, days: int = 30):
     """
     Analyze transactions from Apple financial accounts.
 
     Args:
+        mm: An already-authenticated client to reuse; created from
+            MONARCH_TOKEN when omitted.
+        accounts: A pre-fetched get_accounts() response to reuse; fetched
+            when omitted.
         days: Number of days of transaction history to analyze (default: 30)
     """
-    token = os.getenv('MONARCH_TOKEN')
-
-    if not token:
-        print("⚠️  No MONARCH_TOKEN environment variable found.")
-        print("\nTo get your token:")
-        print("1. Log into https://app.monarchmoney.com")
-        print("2. Open Developer Tools (F12)")
-        print("3. Go to Network tab")
-        print("4. Look for any GraphQL request")
-        print("5. Check the Request Headers for 'Authorization: Token YOUR_TOKEN_HERE'")
-        print("\nThen set it with: export MONARCH_TOKEN='your_token_here'")
-        return None
-
-    mm = MonarchMoney(token=token)
+    if mm is None:
+        mm = get_client()
+        if mm is None:
+            return None
 
     try:
         # Get Apple accounts
         print("\n🔄 Finding Apple accounts...")
-        accounts = await mm.get_accounts()
+        if accounts is None:
+            accounts = await cached_get_accounts(mm)
 
-        apple_accounts = []
-        for account in accounts.get('accounts', []):
-            institution = account.get('institution', {}).get('name', '')
-            if any(provider in institution for provider in APPLE_PROVIDERS):
-                apple_accounts.append(account)
+        apple_accounts = find_apple_accounts(accounts)
 
         if not apple_accounts:
             print("\n❌ No Apple financial accounts found.")
@@ -52,24 +56,34 @@ async def analyze_apple_transactions(days: int = 30):
 
         print(f"\n✅ Found {len(apple_accounts)} Apple accounts")
 
-        # Get transactions for each account
-        end_date = datetime.now().strftime("%Y-%m-%d")
-        start_date = (datetime.now() - timedelta(days=days)).strftime("%Y-%m-%d")
+        # Compute both date strings from one clock read so the window can't
+        # straddle midnight between the two calls.
+        now = datetime.now()
+        end_date = now.date().isoformat()
+        start_date = (now - timedelta(days=days)).date().isoformat()
 
         print(f"\n🔄 Analyzing transactions from {start_date} to {end_date}...")
 
-        for account in apple_accounts:
-            account_id = account.get('id')
-            account_name = account.get('displayName', 'Unknown')
-
-            print(f"\n📊 {account_name}")
+        # Every export lands in the same directory; create it once.
+        os.makedirs("data/exports", exist_ok=True)
 
-            transactions = await mm.get_transactions(
+        # Fetch each account's transactions concurrently; the queries are
+        # independent, so total fetch time is one round-trip, not one per account.
+        transaction_results = await asyncio.gather(*[
+            mm.get_transactions(
                 start_date=start_date,
                 end_date=end_date,
-                account_ids=[account_id],
+                account_ids=[account.get('id')],
                 limit=1000
             )
+            for account in apple_accounts
+        ])
+
+        for account, transactions in zip(apple_accounts, transaction_results):
+            account_id = account.get('id')
+            account_name = account.get('displayName', 'Unknown')
+
+            print(f"\n📊 {account_name}")
 
             transaction_list = transactions.get('allTransactions', {}).get('results', [])
             if not transaction_list:
@@ -78,10 +92,10 @@ async def analyze_apple_transactions(days: int = 30):
 
             print(f"   Found {len(transaction_list)} transactions")
 
-            # Analyze transactions
+            # Analyze transactions in a single pass
             total_amount = 0
-            categories = {}
-            merchants = {}
+            categories = defaultdict(float)
+            merchants = defaultdict(float)
 
             for transaction in transaction_list:
                 amount = transaction.get('amount', 0)
@@ -89,16 +103,21 @@ async def analyze_apple_transactions(days: int = 30):
 
                 # Track categories
                 category = transaction.get('category', {}).get('name', 'Uncategorized')
-                categories[category] = categories.get(category, 0) + amount
+                categories[category] += amount
 
                 # Track merchants
                 merchant = transaction.get('merchant', {}).get('name', 'Unknown')
-                merchants[merchant] = merchants.get(merchant, 0) + amount
+                merchants[merchant] += amount
+
+            categories = dict(categories)
+            merchants = dict(merchants)
 
             print(f"   Total Amount: ${total_amount:,.2f}")
 
-            # Save transaction data
-            transaction_data = {
+            # Save the aggregates to a small meta file and stream the raw
+            # transactions line-by-line as JSONL, so the full list is never
+            # re-materialized as one giant JSON string.
+            transaction_meta = {
                 'account_id': account_id,
                 'account_name': account_name,
                 'start_date': start_date,
@@ -107,25 +126,29 @@ async def analyze_apple_transactions(days: int = 30):
                 'transaction_count': len(transaction_list),
                 'categories': categories,
                 'merchants': merchants,
-                'transactions': transaction_list
             }
 
-            filename = f"data/exports/{account_name.replace(' ', '_')}_transactions.json"
-            os.makedirs(os.path.dirname(filename), exist_ok=True)
-            with open(filename, 'w') as f:
-                json.dump(transaction_data, f, indent=2)
-            print(f"   Data saved to: {filename}")
+            basename = f"data/exports/{account_name.replace(' ', '_')}_transactions"
+            meta_filename = f"{basename}.meta.json"
+            jsonl_filename = f"{basename}.jsonl"
+            # Run the blocking file writes on the thread pool so the event
+            # loop stays free for any still-in-flight network work.
+            await asyncio.to_thread(
+                _write_export, meta_filename, transaction_meta,
+                jsonl_filename, transaction_list,
+            )
+            print(f"   Data saved to: {meta_filename} and {jsonl_filename}")
 
-            # Show top categories
+            # Show top categories (nlargest avoids a full sort for top-5)
             print("\n   Top Categories:")
-            sorted_categories = sorted(categories.items(), key=lambda x: abs(x[1]), reverse=True)
-            for category, amount in sorted_categories[:5]:
+            top_categories = heapq.nlargest(5, categories.items(), key=lambda kv: abs(kv[1]))
+            for category, amount in top_categories:
                 print(f"   - {category}: ${amount:,.2f}")
 
             # Show top merchants
             print("\n   Top Merchants:")
-            sorted_merchants = sorted(merchants.items(), key=lambda x: abs(x[1]), reverse=True)
-            for merchant, amount in sorted_merchants[:5]:
+            top_merchants = heapq.nlargest(5, merchants.items(), key=lambda kv: abs(kv[1]))
+            for merchant, amount in top_merchants:
                 print(f"   - {merchant}: ${amount:,.2f}")
 
             print("\n" + "-"*40)
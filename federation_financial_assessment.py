@@ -7,13 +7,32 @@ to provide a comprehensive assessment of financial health and opportunities.
 """
 
 import asyncio
-import json
 import os
 from datetime import datetime, timedelta
 from typing import Dict, List, Any
 
+import orjson
+import pandas as pd
+
 from monarchmoney import MonarchMoney
 
+def safe_div(a: float, b: float) -> float:
+    """Divide, returning 0.0 when the denominator is zero."""
+    return a / b if b else 0.0
+
+def _agg_by(keys: pd.Series, amounts: pd.Series) -> Dict[str, Dict[str, Any]]:
+    """Group amounts by key and return {key: {count, total, average}} dicts."""
+    grouped = pd.DataFrame({'key': keys, 'amount': amounts}) \
+        .groupby('key', sort=False)['amount'].agg(['count', 'sum'])
+    return {
+        key: {
+            'count': int(row['count']),
+            'total': float(row['sum']),
+            'average': float(row['sum'] / row['count']),
+        }
+        for key, row in grouped.iterrows()
+    }
+
 class FederationAssessment:
     def __init__(self, token: str = None):
         """Initialize with optional token."""
@@ -27,18 +46,9 @@ class FederationAssessment:
         accounts = await self.mm.get_accounts()
         account_list = accounts.get('accounts', [])
 
-        # Group accounts by type
-        account_types = {}
-        for account in account_list:
-            type_name = account.get('type', {}).get('name', 'unknown')
-            if type_name not in account_types:
-                account_types[type_name] = []
-            account_types[type_name].append(account)
-
-        # Calculate metrics
         metrics = {
             'total_accounts': len(account_list),
-            'account_types': len(account_types),
+            'account_types': 0,
             'total_assets': 0,
             'total_liabilities': 0,
             'account_distribution': {},
@@ -46,65 +56,89 @@ class FederationAssessment:
             'manual_accounts': 0,
             'synced_accounts': 0,
             'active_accounts': 0,
-            'inactive_accounts': 0
+            'inactive_accounts': 0,
+            'net_worth': 0,
+        }
+
+        if not account_list:
+            return metrics
+
+        # Flatten once into columns and let pandas do the grouping and sums
+        # in C instead of per-account Python dict lookups.
+        df = pd.json_normalize(account_list)
+        for column, default in (
+            ('currentBalance', 0.0),
+            ('isAsset', True),
+            ('isManual', False),
+            ('deactivatedAt', None),
+            ('type.name', 'unknown'),
+            ('type.display', 'Unknown'),
+            ('institution.name', 'Unknown'),
+        ):
+            if column not in df:
+                df[column] = default
+
+        balance = pd.to_numeric(df['currentBalance'], errors='coerce').fillna(0.0)
+        is_asset = df['isAsset'].fillna(True).astype(bool)
+        is_manual = df['isManual'].fillna(False).astype(bool)
+        inactive = df['deactivatedAt'].notna()
+
+        metrics['account_types'] = int(df['type.name'].fillna('unknown').nunique())
+        metrics['total_assets'] = float(balance[is_asset].sum())
+        metrics['total_liabilities'] = float(balance[~is_asset].abs().sum())
+        metrics['account_distribution'] = {
+            type_name: int(count)
+            for type_name, count in df['type.display'].fillna('Unknown').value_counts().items()
+        }
+        metrics['manual_accounts'] = int(is_manual.sum())
+        metrics['synced_accounts'] = int((~is_manual).sum())
+        metrics['inactive_accounts'] = int(inactive.sum())
+        metrics['active_accounts'] = int((~inactive).sum())
+
+        by_institution = pd.DataFrame({
+            'institution': df['institution.name'].fillna('Unknown'),
+            'balance': balance,
+            'is_asset': is_asset,
+        }).groupby('institution', sort=False).agg(
+            accounts=('balance', 'size'),
+            total_balance=('balance', 'sum'),
+            asset_accounts=('is_asset', 'sum'),
+        )
+        metrics['institution_distribution'] = {
+            institution: {
+                'accounts': int(row.accounts),
+                'total_balance': float(row.total_balance),
+                'asset_accounts': int(row.asset_accounts),
+                'liability_accounts': int(row.accounts - row.asset_accounts),
+            }
+            for institution, row in by_institution.iterrows()
         }
 
-        institutions = {}
-
-        for account in account_list:
-            # Asset/liability tracking
-            balance = account.get('currentBalance', 0) or 0
-            if account.get('isAsset', True):
-                metrics['total_assets'] += balance
-            else:
-                metrics['total_liabilities'] += abs(balance)
-
-            # Account type distribution
-            type_name = account.get('type', {}).get('display', 'Unknown')
-            metrics['account_distribution'][type_name] = metrics['account_distribution'].get(type_name, 0) + 1
-
-            # Institution tracking
-            institution = account.get('institution', {}).get('name', 'Unknown')
-            if institution not in institutions:
-                institutions[institution] = {
-                    'accounts': 0,
-                    'total_balance': 0,
-                    'asset_accounts': 0,
-                    'liability_accounts': 0
-                }
-            institutions[institution]['accounts'] += 1
-            institutions[institution]['total_balance'] += balance
-            if account.get('isAsset', True):
-                institutions[institution]['asset_accounts'] += 1
-            else:
-                institutions[institution]['liability_accounts'] += 1
-
-            # Manual vs synced tracking
-            if account.get('isManual', False):
-                metrics['manual_accounts'] += 1
-            else:
-                metrics['synced_accounts'] += 1
-
-            # Active vs inactive tracking
-            if account.get('deactivatedAt'):
-                metrics['inactive_accounts'] += 1
-            else:
-                metrics['active_accounts'] += 1
-
-        metrics['institution_distribution'] = institutions
         metrics['net_worth'] = metrics['total_assets'] - metrics['total_liabilities']
 
         return metrics
 
     async def analyze_transactions(self, days: int = 30) -> Dict[str, Any]:
         """Analyze recent transactions across all accounts."""
-        end_date = datetime.now().strftime("%Y-%m-%d")
-        start_date = (datetime.now() - timedelta(days=days)).strftime("%Y-%m-%d")
+        # One clock read for both bounds of the window.
+        now = datetime.now()
+        end_date = now.strftime("%Y-%m-%d")
+        start_date = (now - timedelta(days=days)).strftime("%Y-%m-%d")
 
+        # Project down to the six fields the aggregation reads; the full
+        # transaction object is several times larger on the wire.
         transactions = await self.mm.get_transactions(
             start_date=start_date,
             end_date=end_date,
-            limit=1000
+            limit=1000,
+            fields=[
+                'amount',
+                'date',
+                'isRecurring',
+                'category.name',
+                'merchant.name',
+                'account.displayName',
+            ],
         )
 
         transaction_list = transactions.get('allTransactions', {}).get('results', [])
@@ -120,80 +154,48 @@ class FederationAssessment:
             'recurring_transactions': 0
         }
 
-        for transaction in transaction_list:
-            amount = transaction.get('amount', 0)
-
-            # Track inflow/outflow
-            if amount > 0:
-                metrics['total_inflow'] += amount
-            else:
-                metrics['total_outflow'] += abs(amount)
-
-            # Track categories
-            category = transaction.get('category', {}).get('name', 'Uncategorized')
-            if category not in metrics['categories']:
-                metrics['categories'][category] = {
-                    'count': 0,
-                    'total': 0,
-                    'average': 0
-                }
-            metrics['categories'][category]['count'] += 1
-            metrics['categories'][category]['total'] += amount
-            metrics['categories'][category]['average'] = (
-                metrics['categories'][category]['total'] /
-                metrics['categories'][category]['count']
-            )
-
-            # Track merchants
-            merchant = transaction.get('merchant', {}).get('name', 'Unknown')
-            if merchant not in metrics['merchants']:
-                metrics['merchants'][merchant] = {
-                    'count': 0,
-                    'total': 0,
-                    'average': 0
-                }
-            metrics['merchants'][merchant]['count'] += 1
-            metrics['merchants'][merchant]['total'] += amount
-            metrics['merchants'][merchant]['average'] = (
-                metrics['merchants'][merchant]['total'] /
-                metrics['merchants'][merchant]['count']
+        if transaction_list:
+            # One flattening pass, then vectorized groupbys; the running
+            # per-transaction average recomputation disappears entirely —
+            # averages are derived once from the final count/sum.
+            df = pd.json_normalize(transaction_list)
+            for column, default in (
+                ('amount', 0.0),
+                ('date', ''),
+                ('isRecurring', False),
+                ('category.name', 'Uncategorized'),
+                ('merchant.name', 'Unknown'),
+                ('account.displayName', 'Unknown'),
+            ):
+                if column not in df:
+                    df[column] = default
+
+            amount = pd.to_numeric(df['amount'], errors='coerce').fillna(0.0)
+            inflow = amount > 0
+
+            metrics['total_inflow'] = float(amount[inflow].sum())
+            metrics['total_outflow'] = float(amount[~inflow].abs().sum())
+            metrics['recurring_transactions'] = int(
+                df['isRecurring'].fillna(False).astype(bool).sum()
             )
-
-            # Track accounts
-            account = transaction.get('account', {}).get('displayName', 'Unknown')
-            if account not in metrics['accounts']:
-                metrics['accounts'][account] = {
-                    'count': 0,
-                    'total': 0,
-                    'average': 0
-                }
-            metrics['accounts'][account]['count'] += 1
-            metrics['accounts'][account]['total'] += amount
-            metrics['accounts'][account]['average'] = (
-                metrics['accounts'][account]['total'] /
-                metrics['accounts'][account]['count']
-            )
-
-            # Track daily volume
-            date = transaction.get('date', '')
-            if date:
-                if date not in metrics['daily_volume']:
-                    metrics['daily_volume'][date] = {
-                        'count': 0,
-                        'total': 0
-                    }
-                metrics['daily_volume'][date]['count'] += 1
-                metrics['daily_volume'][date]['total'] += abs(amount)
-
-            # Track recurring transactions
-            if transaction.get('isRecurring', False):
-                metrics['recurring_transactions'] += 1
+            metrics['categories'] = _agg_by(df['category.name'].fillna('Uncategorized'), amount)
+            metrics['merchants'] = _agg_by(df['merchant.name'].fillna('Unknown'), amount)
+            metrics['accounts'] = _agg_by(df['account.displayName'].fillna('Unknown'), amount)
+
+            dates = df['date'].fillna('')
+            dated = dates != ''
+            daily = pd.DataFrame({'date': dates[dated], 'volume': amount[dated].abs()}) \
+                .groupby('date', sort=False)['volume'].agg(['count', 'sum'])
+            metrics['daily_volume'] = {
+                date: {'count': int(row['count']), 'total': float(row['sum'])}
+                for date, row in daily.iterrows()
+            }
 
         # Calculate averages
         metrics['average_daily_transactions'] = metrics['total_transactions'] / days
-        metrics['average_transaction_size'] = (
-            (metrics['total_inflow'] + metrics['total_outflow']) /
-            metrics['total_transactions'] if metrics['total_transactions'] > 0 else 0
+        metrics['average_transaction_size'] = safe_div(
+            metrics['total_inflow'] + metrics['total_outflow'],
+            metrics['total_transactions'],
         )
 
         # Sort and limit lists
@@ -213,14 +215,20 @@ class FederationAssessment:
 
     async def generate_assessment(self) -> Dict[str, Any]:
         """Generate comprehensive financial assessment."""
-        print("\n🔄 Analyzing accounts...")
-        account_metrics = await self.analyze_accounts()
+        # The two analyses issue independent GraphQL queries; run them
+        # concurrently so wall-clock is the slower of the two, not the sum.
+        print("\n🔄 Analyzing accounts and transactions...")
+        account_metrics, transaction_metrics = await asyncio.gather(
+            self.analyze_accounts(),
+            self.analyze_transactions(),
+        )
 
-        print("🔄 Analyzing transactions...")
-        transaction_metrics = await self.analyze_transactions()
+        # One timestamp for the whole assessment: the dict, the filename
+        # and the markdown header all describe the same run.
+        generated_at = datetime.now()
 
         assessment = {
-            'timestamp': datetime.now().isoformat(),
+            'timestamp': generated_at.isoformat(),
             'account_metrics': account_metrics,
             'transaction_metrics': transaction_metrics,
             'insights': []
@@ -243,10 +251,9 @@ class FederationAssessment:
             })
 
         # Transaction insights
-        recurring_ratio = (
-            transaction_metrics['recurring_transactions'] /
-            transaction_metrics['total_transactions']
-            if transaction_metrics['total_transactions'] > 0 else 0
+        recurring_ratio = safe_div(
+            transaction_metrics['recurring_transactions'],
+            transaction_metrics['total_transactions'],
         )
         if recurring_ratio < 0.1:
             insights.append({
@@ -255,46 +262,52 @@ class FederationAssessment:
             })
 
         # Financial health insights
-        if account_metrics['total_liabilities'] > 0:
-            debt_ratio = account_metrics['total_liabilities'] / account_metrics['total_assets']
-            if debt_ratio > 0.5:
-                insights.append({
-                    'type': 'warning',
-                    'message': 'High debt-to-asset ratio detected'
-                })
+        debt_ratio = safe_div(
+            account_metrics['total_liabilities'],
+            account_metrics['total_assets'],
+        )
+        if debt_ratio > 0.5:
+            insights.append({
+                'type': 'warning',
+                'message': 'High debt-to-asset ratio detected'
+            })
 
         assessment['insights'] = insights
 
         # Save assessment
-        filename = f"data/federation_assessment/assessment_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json"
+        filename = f"data/federation_assessment/assessment_{generated_at.strftime('%Y%m%d_%H%M%S')}.json"
         os.makedirs(os.path.dirname(filename), exist_ok=True)
-        with open(filename, 'w') as f:
-            json.dump(assessment, f, indent=2)
+        with open(filename, 'wb') as f:
+            f.write(orjson.dumps(assessment, option=orjson.OPT_INDENT_2))
 
         # Generate summary markdown
         summary_file = "federation_assessment/CURRENT_FINANCIAL_SUMMARY.md"
         os.makedirs(os.path.dirname(summary_file), exist_ok=True)
+        # Build the summary in memory and emit it with a single write
+        # instead of ~20 separate buffered-IO calls.
+        parts = [
+            "# Current Financial Summary\n\n",
+            f"Generated: {generated_at.strftime('%Y-%m-%d %H:%M:%S')}\n\n",
+            "## Account Overview\n\n",
+            f"- Total Accounts: {account_metrics['total_accounts']}\n",
+            f"- Active Accounts: {account_metrics['active_accounts']}\n",
+            f"- Total Assets: ${account_metrics['total_assets']:,.2f}\n",
+            f"- Total Liabilities: ${account_metrics['total_liabilities']:,.2f}\n",
+            f"- Net Worth: ${account_metrics['net_worth']:,.2f}\n\n",
+            "## Transaction Analysis\n\n",
+            f"- Total Transactions: {transaction_metrics['total_transactions']}\n",
+            f"- Total Inflow: ${transaction_metrics['total_inflow']:,.2f}\n",
+            f"- Total Outflow: ${transaction_metrics['total_outflow']:,.2f}\n",
+            f"- Average Daily Transactions: {transaction_metrics['average_daily_transactions']:.1f}\n",
+            f"- Recurring Transactions: {transaction_metrics['recurring_transactions']}\n\n",
+            "## Insights\n\n",
+        ]
+        parts.extend(
+            f"- [{insight['type'].upper()}] {insight['message']}\n"
+            for insight in insights
+        )
         with open(summary_file, 'w') as f:
-            f.write("# Current Financial Summary\n\n")
-            f.write(f"Generated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n\n")
-
-            f.write("## Account Overview\n\n")
-            f.write(f"- Total Accounts: {account_metrics['total_accounts']}\n")
-            f.write(f"- Active Accounts: {account_metrics['active_accounts']}\n")
-            f.write(f"- Total Assets: ${account_metrics['total_assets']:,.2f}\n")
-            f.write(f"- Total Liabilities: ${account_metrics['total_liabilities']:,.2f}\n")
-            f.write(f"- Net Worth: ${account_metrics['net_worth']:,.2f}\n\n")
-
-            f.write("## Transaction Analysis\n\n")
-            f.write(f"- Total Transactions: {transaction_metrics['total_transactions']}\n")
-            f.write(f"- Total Inflow: ${transaction_metrics['total_inflow']:,.2f}\n")
-            f.write(f"- Total Outflow: ${transaction_metrics['total_outflow']:,.2f}\n")
-            f.write(f"- Average Daily Transactions: {transaction_metrics['average_daily_transactions']:.1f}\n")
-            f.write(f"- Recurring Transactions: {transaction_metrics['recurring_transactions']}\n\n")
-
-            f.write("## Insights\n\n")
-            for insight in insights:
-                f.write(f"- [{insight['type'].upper()}] {insight['message']}\n")
+            f.write("".join(parts))
 
         print(f"\n✅ Assessment saved to {filename}")
         print(f"✅ Summary saved to {summary_file}")
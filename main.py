@@ -4,8 +4,10 @@ Example usage of the MonarchMoney Python SDK.
 """
 
 import asyncio
-import json
 import os
+import sys
+
+import orjson
 from monarchmoney import MonarchMoney
 
 async def main():
@@ -27,13 +29,19 @@ async def main():
     mm = MonarchMoney(token=token)
 
     try:
-        # Get accounts
-        print("\n🔄 Fetching accounts...")
-        accounts = await mm.get_accounts()
-
-        # Save accounts data
-        with open("accounts_data.json", "w") as f:
-            json.dump(accounts, f, indent=2)
+        # Fetch accounts and recent transactions concurrently; the two
+        # GraphQL queries are independent, so wall-clock time is the
+        # slowest call rather than the sum of both.
+        print("\n🔄 Fetching accounts and recent transactions...")
+        accounts, transactions = await asyncio.gather(
+            mm.get_accounts(),
+            mm.get_transactions(limit=5),
+        )
+
+        # Save accounts data (orjson writes bytes directly, skipping the
+        # pretty-printing and str intermediate of the stdlib encoder)
+        with open("accounts_data.json", "wb") as f:
+            f.write(orjson.dumps(accounts))
 
         # Display summary
         account_list = accounts.get('accounts', [])
@@ -42,7 +50,9 @@ async def main():
         total_assets = 0
         total_liabilities = 0
 
-        print("\n" + "="*60)
+        # Build the report in memory and emit it with one write instead of
+        # several print calls (lock + flush) per account.
+        lines = ["\n" + "="*60]
         for account in account_list:
             balance = account.get('currentBalance', 0)
             if balance is None:
@@ -54,41 +64,39 @@ async def main():
             else:
                 total_liabilities += abs(balance)
 
-            print(f"\n📊 {account.get('displayName', 'Unknown')}")
-            print(f"   Type: {account.get('type', {}).get('display', 'Unknown')}")
-            print(f"   Balance: ${balance:,.2f}")
-            print(f"   Institution: {account.get('institution', {}).get('name', 'Unknown')}")
-            print(f"   Asset: {'Yes' if is_asset else 'No (Liability)'}")
+            lines.append(f"\n📊 {account.get('displayName', 'Unknown')}")
+            lines.append(f"   Type: {account.get('type', {}).get('display', 'Unknown')}")
+            lines.append(f"   Balance: ${balance:,.2f}")
+            lines.append(f"   Institution: {account.get('institution', {}).get('name', 'Unknown')}")
+            lines.append(f"   Asset: {'Yes' if is_asset else 'No (Liability)'}")
 
             # Show additional details if available
             if account.get('lastUpdatedAt'):
-                print(f"   Last Updated: {account.get('lastUpdatedAt')}")
+                lines.append(f"   Last Updated: {account.get('lastUpdatedAt')}")
 
-        print("\n" + "="*60)
+        lines.append("\n" + "="*60)
+        sys.stdout.write("\n".join(lines) + "\n")
         print(f"\n💰 Total Assets: ${total_assets:,.2f}")
         print(f"💳 Total Liabilities: ${total_liabilities:,.2f}")
         print(f"📈 Net Worth: ${(total_assets - total_liabilities):,.2f}")
 
         print(f"\n✅ Data saved to accounts_data.json")
 
-        # Get recent transactions
-        print("\n🔄 Fetching recent transactions...")
-        transactions = await mm.get_transactions(limit=5)
-
         # Display recent transactions
         transaction_list = transactions.get('allTransactions', {}).get('results', [])
         print(f"\n✅ Successfully retrieved {len(transaction_list)} recent transactions")
 
-        print("\n" + "="*60)
+        lines = ["\n" + "="*60]
         for transaction in transaction_list:
-            print(f"\n💸 {transaction.get('merchant', {}).get('name', 'Unknown')}")
-            print(f"   Amount: ${transaction.get('amount', 0):,.2f}")
-            print(f"   Date: {transaction.get('date', 'Unknown')}")
-            print(f"   Account: {transaction.get('account', {}).get('displayName', 'Unknown')}")
-            print(f"   Category: {transaction.get('category', {}).get('name', 'Unknown')}")
+            lines.append(f"\n💸 {transaction.get('merchant', {}).get('name', 'Unknown')}")
+            lines.append(f"   Amount: ${transaction.get('amount', 0):,.2f}")
+            lines.append(f"   Date: {transaction.get('date', 'Unknown')}")
+            lines.append(f"   Account: {transaction.get('account', {}).get('displayName', 'Unknown')}")
+            lines.append(f"   Category: {transaction.get('category', {}).get('name', 'Unknown')}")
             if transaction.get('notes'):
-                print(f"   Notes: {transaction.get('notes')}")
-        print("\n" + "="*60)
+                lines.append(f"   Notes: {transaction.get('notes')}")
+        lines.append("\n" + "="*60)
+        sys.stdout.write("\n".join(lines) + "\n")
 
     except Exception as e:
         print(f"\n❌ Error: {e}")
@@ -4,13 +4,30 @@ Migrate transactions from Apple Cash to Monarch Money.
 """
 
 import asyncio
-import json
 import os
+import time
 from datetime import datetime
+from pathlib import Path
 from typing import Dict, List, Any
 
+import orjson
+
 from monarchmoney import MonarchMoney
 
+# Resolved Apple Cash account id, memoized across invocations so reruns
+# skip the get_accounts() round-trip.
+APPLE_CASH_ID_CACHE = ".mm/apple_cash_id"
+APPLE_CASH_ID_TTL_SECONDS = 24 * 3600
+
+def _load_cached_account_id() -> str:
+    """Return the cached Apple Cash account id, or None if absent/stale."""
+    try:
+        if time.time() - os.stat(APPLE_CASH_ID_CACHE).st_mtime < APPLE_CASH_ID_TTL_SECONDS:
+            return Path(APPLE_CASH_ID_CACHE).read_text().strip() or None
+    except FileNotFoundError:
+        pass
+    return None
+
 async def migrate_apple_cash_transactions(input_file: str):
     """
     Migrate Apple Cash transactions to Monarch Money.
@@ -40,8 +57,8 @@ async def migrate_apple_cash_transactions(input_file: str):
     try:
         # Load transactions from file
         print(f"\n🔄 Loading transactions from {input_file}...")
-        with open(input_file, 'r') as f:
-            data = json.load(f)
+        with open(input_file, 'rb') as f:
+            data = orjson.loads(f.read())
 
         transactions = data.get('transactions', [])
         if not transactions:
@@ -50,23 +67,41 @@ async def migrate_apple_cash_transactions(input_file: str):
 
         print(f"\n✅ Loaded {len(transactions)} transactions")
 
-        # Get Apple Cash account
-        print("\n🔄 Finding Apple Cash account...")
-        accounts = await mm.get_accounts()
-
-        apple_cash_account = None
-        for account in accounts.get('accounts', []):
-            institution = account.get('institution', {}).get('name', '')
-            if "Apple Cash" in institution:
-                apple_cash_account = account
-                break
-
-        if not apple_cash_account:
-            print("\n❌ Apple Cash account not found.")
-            return None
-
-        account_id = apple_cash_account.get('id')
-        print(f"\n✅ Found Apple Cash account: {apple_cash_account.get('displayName')}")
+        # Get Apple Cash account, reusing a recently resolved id when we
+        # have one on disk.
+        account_id = _load_cached_account_id()
+        used_cached_id = account_id is not None
+        if account_id:
+            print(f"\n✅ Using cached Apple Cash account id: {account_id}")
+        else:
+            print("\n🔄 Finding Apple Cash account...")
+            accounts = await mm.get_accounts()
+
+            # Substring match, so this can't be a dict lookup; take the
+            # first hit, matching the original behavior when several
+            # accounts share an institution.
+            apple_cash_account = next(
+                (
+                    account
+                    for account in accounts.get('accounts', [])
+                    if "Apple Cash"
+                    in ((account.get('institution') or {}).get('name') or '')
+                ),
+                None,
+            )
+
+            if not apple_cash_account:
+                print("\n❌ Apple Cash account not found.")
+                return None
+
+            account_id = apple_cash_account.get('id')
+            print(f"\n✅ Found Apple Cash account: {apple_cash_account.get('displayName')}")
+
+            # Only cache a real id; an account without one would make
+            # write_text raise and poison the cache for later runs.
+            if account_id:
+                os.makedirs(os.path.dirname(APPLE_CASH_ID_CACHE), exist_ok=True)
+                Path(APPLE_CASH_ID_CACHE).write_text(account_id)
 
         # Get existing transactions to avoid duplicates
         print("\n🔄 Getting existing transactions...")
@@ -76,45 +111,76 @@ async def migrate_apple_cash_transactions(input_file: str):
         )
 
         existing_transactions = existing.get('allTransactions', {}).get('results', [])
-        existing_dates = set()
-        for transaction in existing_transactions:
-            date = transaction.get('date')
-            amount = transaction.get('amount')
-            merchant = transaction.get('merchant', {}).get('name', '')
-            key = f"{date}|{amount}|{merchant}"
-            existing_dates.add(key)
+        # Tuple keys hash their primitive elements directly — no f-string
+        # formatting or allocation per transaction.
+        existing_keys = {
+            (
+                transaction.get('date'),
+                transaction.get('amount'),
+                transaction.get('merchant', {}).get('name', ''),
+            )
+            for transaction in existing_transactions
+        }
 
         print(f"\n✅ Found {len(existing_transactions)} existing transactions")
 
-        # Migrate new transactions
+        # Migrate new transactions concurrently; each create is a full HTTP
+        # round-trip, so dispatching them in bounded batches collapses N
+        # serial round-trips into ~N/8 overlapping ones.
         print("\n🔄 Migrating transactions...")
-        migrated = 0
-        skipped = 0
 
+        new_transactions = []
+        skipped = 0
         for transaction in transactions:
-            date = transaction.get('date')
-            amount = transaction.get('amount')
-            merchant = transaction.get('merchant', '')
-            key = f"{date}|{amount}|{merchant}"
-
-            if key in existing_dates:
+            key = (
+                transaction.get('date'),
+                transaction.get('amount'),
+                transaction.get('merchant', ''),
+            )
+            if key in existing_keys:
                 skipped += 1
-                continue
+            else:
+                new_transactions.append(transaction)
 
-            try:
+        semaphore = asyncio.Semaphore(8)
+
+        async def migrate_one(transaction):
+            async with semaphore:
                 await mm.create_transaction(
-                    date=date,
+                    date=transaction.get('date'),
                     account_id=account_id,
-                    amount=amount,
-                    merchant_name=merchant,
+                    amount=transaction.get('amount'),
+                    merchant_name=transaction.get('merchant', ''),
                     category_id=transaction.get('category_id', ''),
                     notes=transaction.get('notes', ''),
                     update_balance=True
                 )
+
+        results = await asyncio.gather(
+            *(migrate_one(transaction) for transaction in new_transactions),
+            return_exceptions=True
+        )
+
+        migrated = 0
+        for transaction, result in zip(new_transactions, results):
+            if isinstance(result, Exception):
+                print(f"❌ Failed to migrate transaction: {result}")
+            else:
                 migrated += 1
-                print(f"✅ Migrated: {date} - {merchant} - ${amount:,.2f}")
-            except Exception as e:
-                print(f"❌ Failed to migrate transaction: {e}")
+
+        # A 24h-cached account id can go stale (account deleted or
+        # relinked), turning every create into an opaque per-row failure.
+        # On failures with a cached id, re-check it and clear the cache so
+        # the next run rediscovers the account.
+        if migrated < len(new_transactions) and used_cached_id:
+            current = await mm.get_accounts_basic()
+            valid_ids = {
+                account.get('id') for account in current.get('accounts', [])
+            }
+            if account_id not in valid_ids:
+                Path(APPLE_CASH_ID_CACHE).unlink(missing_ok=True)
+                print("\n⚠️  Cached Apple Cash account id is no longer valid.")
+                print("   Cache cleared — re-run to rediscover the account.")
 
         print(f"\n✅ Migration complete!")
         print(f"   Migrated: {migrated}")
@@ -0,0 +1,237 @@
+"""
+GraphQL documents used by the MonarchMoney SDK.
+
+Documents are parsed once when this module is first imported; gql() re-parses
+the DSL into a document on every call otherwise, which is wasted CPU for
+queries issued repeatedly (pagination, chained CLI commands). Keeping them
+out of monarchmoney.py also lets that module defer importing gql until a
+query is actually issued.
+"""
+
+from typing import Any, Dict, List, Optional
+
+from gql import GraphQLRequest, gql
+
+# Full per-transaction selection requested by get_transactions when no
+# field projection is given.
+TRANSACTIONS_DEFAULT_SELECTION = """
+                        id
+                        amount
+                        pending
+                        date
+                        hideFromReports
+                        plaidName
+                        notes
+                        isRecurring
+                        reviewStatus
+                        needsReview
+                        attachments {
+                            id
+                            extension
+                            filename
+                            originalAssetUrl
+                            publicId
+                            sizeBytes
+                            __typename
+                        }
+                        isSplitTransaction
+                        createdAt
+                        updatedAt
+                        category {
+                            id
+                            name
+                            __typename
+                        }
+                        merchant {
+                            name
+                            id
+                            transactionsCount
+                            __typename
+                        }
+                        account {
+                            id
+                            displayName
+                            __typename
+                        }
+                        tags {
+                            id
+                            name
+                            color
+                            order
+                            __typename
+                        }
+                        __typename
+"""
+
+TRANSACTIONS_QUERY_TEMPLATE = """
+            query GetTransactionsList($offset: Int, $limit: Int, $filters: TransactionFilterInput, $orderBy: TransactionOrdering) {
+                allTransactions(filters: $filters) {
+                    totalCount
+                    results(offset: $offset, limit: $limit, orderBy: $orderBy) {
+                        %s
+                    }
+                    __typename
+                }
+            }
+"""
+
+TRANSACTIONS_DEFAULT_QUERY = gql(
+    TRANSACTIONS_QUERY_TEMPLATE % TRANSACTIONS_DEFAULT_SELECTION
+)
+
+GET_ACCOUNTS_QUERY = gql(
+    """
+    query GetAccounts {
+        accounts {
+            id
+            displayName
+            syncDisabled
+            deactivatedAt
+            isHidden
+            isAsset
+            mask
+            createdAt
+            updatedAt
+            displayLastUpdatedAt
+            currentBalance
+            displayBalance
+            includeInNetWorth
+            hideFromList
+            hideTransactionsFromReports
+            includeBalanceInNetWorth
+            includeInGoalBalance
+            dataProvider
+            dataProviderAccountId
+            isManual
+            transactionsCount
+            holdingsCount
+            manualInvestmentsTrackingMethod
+            order
+            logoUrl
+            type {
+                name
+                display
+                __typename
+            }
+            subtype {
+                name
+                display
+                __typename
+            }
+            credential {
+                id
+                updateRequired
+                disconnectedFromDataProviderAt
+                dataProvider
+                institution {
+                    id
+                    plaidInstitutionId
+                    name
+                    status
+                    __typename
+                }
+                __typename
+            }
+            institution {
+                id
+                name
+                primaryColor
+                url
+                __typename
+            }
+            __typename
+        }
+    }
+    """
+)
+
+# Slim variant of GetAccounts used for on-screen summaries: only the
+# handful of fields a listing displays, which cuts both the bytes on the
+# wire and the JSON decode work by an order of magnitude.
+GET_ACCOUNTS_SUMMARY_QUERY = gql(
+    """
+    query GetAccountsSummary {
+        accounts {
+            id
+            displayName
+            currentBalance
+            isAsset
+            lastUpdatedAt
+            type {
+                display
+                __typename
+            }
+            institution {
+                name
+                __typename
+            }
+            __typename
+        }
+    }
+    """
+)
+
+
+# Thinner still: the field sets for callers that only need to identify
+# accounts or read balances, e.g. balance polling or building an id map.
+GET_ACCOUNTS_BASIC_QUERY = gql(
+    """
+    query GetAccountsBasic {
+        accounts {
+            id
+            displayName
+            currentBalance
+            type {
+                name
+                __typename
+            }
+            __typename
+        }
+    }
+    """
+)
+
+GET_ACCOUNTS_BALANCE_ONLY_QUERY = gql(
+    """
+    query GetAccountsBalanceOnly {
+        accounts {
+            id
+            currentBalance
+            __typename
+        }
+    }
+    """
+)
+
+
+def render_selection(fields: List[str]) -> str:
+    """
+    Renders a GraphQL selection set from dotted field paths, e.g.
+    ["amount", "category.name"] -> "amount category { name }".
+    """
+    tree: Dict[str, Any] = {}
+    for field in fields:
+        node = tree
+        for part in field.split("."):
+            node = node.setdefault(part, {})
+
+    def render(node: Dict[str, Any]) -> str:
+        parts = []
+        for name, children in node.items():
+            if children:
+                parts.append(f"{name} {{ {render(children)} }}")
+            else:
+                parts.append(name)
+        return " ".join(parts)
+
+    return render(tree)
+
+
+def transactions_query(fields: Optional[List[str]]) -> GraphQLRequest:
+    """
+    Returns the transactions document for the given field projection,
+    or the precompiled full-selection document when fields is None.
+    """
+    if fields is None:
+        return TRANSACTIONS_DEFAULT_QUERY
+    return gql(TRANSACTIONS_QUERY_TEMPLATE % render_selection(fields))
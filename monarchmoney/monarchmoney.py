@@ -4,24 +4,32 @@ MonarchMoney Python SDK - A Python library for interacting with the Monarch Mone
 
 import asyncio
 import calendar
+import copy
 import getpass
 import json
 import os
-import pickle
 import time
 from datetime import datetime, date, timedelta
-from typing import Dict, Any, Optional, List, Union
-
-import oathtool
-from aiohttp import ClientSession, FormData
-from gql import Client, gql
-from gql.transport.aiohttp import AIOHTTPTransport
-from graphql import DocumentNode
+from types import MappingProxyType
+from typing import TYPE_CHECKING, Dict, Any, Optional, List, Union
+
+# gql, aiohttp, the AIOHTTPTransport wrapper and oathtool are imported
+# lazily at their points of use (the query documents live in _queries.py),
+# keeping 'from monarchmoney import MonarchMoney' cheap for callers that
+# never open a connection (save_session, set_token).
+if TYPE_CHECKING:
+    from aiohttp import ClientSession, TCPConnector
+    from gql import Client, GraphQLRequest
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 AUTH_HEADER_KEY = "authorization"
 CSRF_KEY = "csrftoken"
 SESSION_DIR = ".mm"
-SESSION_FILE = f"{SESSION_DIR}/mm_session.pickle"
+SESSION_FILE = f"{SESSION_DIR}/mm_session.json"
 
 
 class RequireMFAException(Exception):
@@ -49,24 +57,43 @@ class MonarchMoneyEndpoints(object):
 
 
 class MonarchMoney(object):
+    # Packaged introspection schema, shared by every instance. Loaded (or
+    # found absent) at most once per process.
+    _local_schema = None
+    _local_schema_loaded = False
+
+    # Default headers, built once and shared read-only by every instance;
+    # an instance copies them only when it needs to attach Authorization.
+    _BASE_HEADERS = MappingProxyType(
+        {
+            "Accept": "application/json",
+            "Client-Platform": "web",
+            "Content-Type": "application/json",
+            "User-Agent": "MonarchMoneyAPI (https://github.com/hammem/monarchmoney)",
+        }
+    )
+
     def __init__(
         self,
         session_file: str = SESSION_FILE,
         timeout: int = 10,
         token: Optional[str] = None,
     ) -> None:
-        self._headers = {
-            "Accept": "application/json",
-            "Client-Platform": "web",
-            "Content-Type": "application/json",
-            "User-Agent": "MonarchMoneyAPI (https://github.com/hammem/monarchmoney)",
-        }
+        self._headers = self._BASE_HEADERS
+        self._token = token
         if token:
-            self._headers["Authorization"] = f"Token {token}"
+            self._set_auth_header()
 
         self._session_file = session_file
-        self._token = token
+        self._resolved_session_path: Optional[str] = None
+        self._session_dir_ready = False
         self._timeout = timeout
+        self._client: Optional["Client"] = None
+        self._connector: Optional["TCPConnector"] = None
+        self._gql_session = None
+        self._http: Optional["ClientSession"] = None
+        self._response_cache: Dict[Any, Any] = {}
+        self._inflight: Dict[Any, "asyncio.Task"] = {}
 
     @property
     def timeout(self) -> int:
@@ -76,39 +103,122 @@ class MonarchMoney(object):
     def set_timeout(self, timeout_secs: int) -> None:
         """Sets the default timeout on GraphQL API calls, in seconds."""
         self._timeout = timeout_secs
+        self._invalidate_client()
 
     @property
     def token(self) -> Optional[str]:
         return self._token
 
+    def _headers_for(self, kind: str) -> Any:
+        """
+        Returns the header set for "graphql" or "auth" requests. Auth
+        routes don't carry a static Content-Type — aiohttp stamps the
+        right one per request body — so those requests stay a few bytes
+        smaller and can't mislabel a body-less call.
+        """
+        if kind == "auth":
+            return {
+                name: value
+                for name, value in self._headers.items()
+                if name != "Content-Type"
+            }
+        return self._headers
+
+    def _set_auth_header(self) -> None:
+        """Attaches the current token, copying the shared headers first."""
+        if not isinstance(self._headers, dict):
+            self._headers = dict(self._headers)
+        self._headers["Authorization"] = f"Token {self._token}"
+
     def set_token(self, token: str) -> None:
         self._token = token
+        self._invalidate_client()
+
+    def _invalidate_client(self) -> None:
+        """
+        Drops the cached client so the next call rebuilds it with the
+        current token and timeout. If a persistent session or connector
+        is open, its shutdown is scheduled on the running loop — the
+        setters calling this are synchronous, so it can't be awaited
+        here.
+        """
+        client = self._client
+        session = self._gql_session
+        connector = self._connector
+        self._client = None
+        self._gql_session = None
+        self._connector = None
+        if client is None and connector is None:
+            return
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            # No running loop: the session's loop is gone too, so there
+            # is nothing left to shut down cleanly.
+            return
+        if client is not None and session is not None:
+            loop.create_task(client.close_async())
+        if connector is not None:
+            loop.create_task(connector.close())
 
     def save_session(self, filename: Optional[str] = None) -> None:
         """
         Saves the auth token needed to access a Monarch Money account.
         """
+        # The default session path is resolved once and its directory
+        # created once per instance; repeat saves skip both syscalls.
         if filename is None:
-            filename = self._session_file
-        filename = os.path.abspath(filename)
+            if self._resolved_session_path is None:
+                self._resolved_session_path = os.path.abspath(self._session_file)
+            filename = self._resolved_session_path
+        else:
+            filename = os.path.abspath(filename)
 
         session_data = {"token": self._token}
 
-        os.makedirs(os.path.dirname(filename), exist_ok=True)
-        with open(filename, "wb") as fh:
-            pickle.dump(session_data, fh)
+        if not (self._session_dir_ready and filename is self._resolved_session_path):
+            os.makedirs(os.path.dirname(filename), exist_ok=True)
+            if filename is self._resolved_session_path:
+                self._session_dir_ready = True
+
+        # Write to a sibling temp file and rename into place so a crash
+        # mid-write can never leave a torn session file behind (which
+        # would force a re-login, and possibly MFA, on the next run).
+        tmp_filename = filename + ".tmp"
+        try:
+            with open(tmp_filename, "w") as fh:
+                json.dump(session_data, fh)
+                fh.flush()
+                os.fsync(fh.fileno())
+            os.replace(tmp_filename, filename)
+        except BaseException:
+            try:
+                os.remove(tmp_filename)
+            except FileNotFoundError:
+                pass
+            raise
 
     def load_session(self, filename: Optional[str] = None) -> None:
         """
-        Loads pre-existing auth token from a Python pickle file.
+        Loads pre-existing auth token from a JSON session file.
+
+        Session files written before the switch to JSON were pickled; those
+        are still readable and get rewritten as JSON on the next save.
         """
         if filename is None:
             filename = self._session_file
 
-        with open(filename, "rb") as fh:
-            data = pickle.load(fh)
-            self.set_token(data["token"])
-            self._headers["Authorization"] = f"Token {self._token}"
+        try:
+            with open(filename, "r") as fh:
+                data = json.load(fh)
+        except (ValueError, UnicodeDecodeError):
+            import pickle
+
+            with open(filename, "rb") as fh:
+                data = pickle.load(fh)
+
+        self.set_token(data["token"])
+        self._set_auth_header()
 
     def delete_session(self, filename: Optional[str] = None) -> None:
         """
@@ -117,8 +227,12 @@ class MonarchMoney(object):
         if filename is None:
             filename = self._session_file
 
-        if os.path.exists(filename):
+        # One syscall instead of exists()+remove(), with no window for the
+        # file to disappear in between.
+        try:
             os.remove(filename)
+        except FileNotFoundError:
+            pass
 
     async def login(
         self,
@@ -138,7 +252,16 @@ class MonarchMoney(object):
             raise LoginFailedException(
                 "Email and password are required to login when not using a saved session."
             )
-        await self._login_user(email, password, mfa_secret_key)
+        try:
+            await self._login_user(email, password, mfa_secret_key)
+        except RequireMFAException:
+            # Leave the shared auth session open: the caller's MFA step
+            # reuses it and closes it when it finishes.
+            raise
+        except BaseException:
+            await self._close_http()
+            raise
+        await self._close_http()
         if save_session:
             self.save_session(self._session_file)
 
@@ -161,78 +284,96 @@ class MonarchMoney(object):
         self, email: str, password: str, code: str
     ) -> None:
         """Performs multi-factor authentication to access a Monarch Money account."""
-        await self._multi_factor_authenticate(email, password, code)
+        try:
+            await self._multi_factor_authenticate(email, password, code)
+        finally:
+            await self._close_http()
+
+    async def connect(self) -> None:
+        """
+        Opens a persistent GraphQL session. Once connected, every
+        gql_call rides the same underlying connection — no per-query
+        TCP/TLS handshake or DNS lookup — until close() is called.
+        Optional: without it each call still works, reconnecting as
+        needed.
+        """
+        if self._gql_session is None:
+            self._gql_session = await self._get_graphql_client().connect_async(
+                reconnecting=True
+            )
+
+    async def close(self) -> None:
+        """
+        Closes the persistent GraphQL session, the shared connector and
+        the shared HTTP session. The client is dropped too, so the next
+        call rebuilds it around a fresh connector.
+        """
+        client = self._client
+        session = self._gql_session
+        connector = self._connector
+        self._client = None
+        self._gql_session = None
+        self._connector = None
+        if client is not None and session is not None:
+            await client.close_async()
+        if connector is not None:
+            await connector.close()
+        await self._close_http()
+
+    async def __aenter__(self) -> "MonarchMoney":
+        await self.connect()
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback) -> None:
+        await self.close()
 
     async def get_accounts(self) -> Dict[str, Any]:
         """Gets the list of accounts configured in the Monarch Money account."""
-        query = gql(
-            """
-            query GetAccounts {
-                accounts {
-                    id
-                    displayName
-                    syncDisabled
-                    deactivatedAt
-                    isHidden
-                    isAsset
-                    mask
-                    createdAt
-                    updatedAt
-                    displayLastUpdatedAt
-                    currentBalance
-                    displayBalance
-                    includeInNetWorth
-                    hideFromList
-                    hideTransactionsFromReports
-                    includeBalanceInNetWorth
-                    includeInGoalBalance
-                    dataProvider
-                    dataProviderAccountId
-                    isManual
-                    transactionsCount
-                    holdingsCount
-                    manualInvestmentsTrackingMethod
-                    order
-                    logoUrl
-                    type {
-                        name
-                        display
-                        __typename
-                    }
-                    subtype {
-                        name
-                        display
-                        __typename
-                    }
-                    credential {
-                        id
-                        updateRequired
-                        disconnectedFromDataProviderAt
-                        dataProvider
-                        institution {
-                            id
-                            plaidInstitutionId
-                            name
-                            status
-                            __typename
-                        }
-                        __typename
-                    }
-                    institution {
-                        id
-                        name
-                        primaryColor
-                        url
-                        __typename
-                    }
-                    __typename
-                }
-            }
+        from ._queries import GET_ACCOUNTS_QUERY
+
+        return await self.gql_call(
+            operation="GetAccounts",
+            graphql_query=GET_ACCOUNTS_QUERY,
+        )
+
+    async def get_accounts_summary(self) -> Dict[str, Any]:
+        """
+        Gets the list of accounts with only summary fields: id, name,
+        balance, asset flag, last-updated time, type and institution.
+        Use this over
+        :meth:`get_accounts` when displaying a listing — the response is
+        a fraction of the size of the full account objects.
+        """
+        from ._queries import GET_ACCOUNTS_SUMMARY_QUERY
+
+        return await self.gql_call(
+            operation="GetAccountsSummary",
+            graphql_query=GET_ACCOUNTS_SUMMARY_QUERY,
+        )
+
+    async def get_accounts_basic(self) -> Dict[str, Any]:
+        """
+        Gets the list of accounts with only id, name, balance and type
+        name — enough to build an account map or pick one by name without
+        downloading the full objects.
         """
+        from ._queries import GET_ACCOUNTS_BASIC_QUERY
+
+        return await self.gql_call(
+            operation="GetAccountsBasic",
+            graphql_query=GET_ACCOUNTS_BASIC_QUERY,
         )
+
+    async def get_accounts_balance_only(self) -> Dict[str, Any]:
+        """
+        Gets only account ids and current balances — the cheapest possible
+        accounts read, suited to frequent balance polling.
+        """
+        from ._queries import GET_ACCOUNTS_BALANCE_ONLY_QUERY
+
         return await self.gql_call(
-            operation="GetAccounts",
-            graphql_query=query,
+            operation="GetAccountsBalanceOnly",
+            graphql_query=GET_ACCOUNTS_BALANCE_ONLY_QUERY,
         )
 
     async def get_transactions(
@@ -245,6 +386,7 @@ class MonarchMoney(object):
         category_ids: List[str] = [],
         account_ids: List[str] = [],
         tag_ids: List[str] = [],
+        fields: Optional[List[str]] = None,
     ) -> Dict[str, Any]:
         """
         Gets transaction data from the account.
@@ -257,65 +399,13 @@ class MonarchMoney(object):
         :param category_ids: a list of category ids to filter.
         :param account_ids: a list of account ids to filter.
         :param tag_ids: a list of tag ids to filter.
+        :param fields: optional dotted field paths (e.g. ["amount", "category.name"])
+            to request instead of the full transaction object, shrinking the
+            response payload. None requests every field.
         """
-        query = gql(
-            """
-            query GetTransactionsList($offset: Int, $limit: Int, $filters: TransactionFilterInput, $orderBy: TransactionOrdering) {
-                allTransactions(filters: $filters) {
-                    totalCount
-                    results(offset: $offset, limit: $limit, orderBy: $orderBy) {
-                        id
-                        amount
-                        pending
-                        date
-                        hideFromReports
-                        plaidName
-                        notes
-                        isRecurring
-                        reviewStatus
-                        needsReview
-                        attachments {
-                            id
-                            extension
-                            filename
-                            originalAssetUrl
-                            publicId
-                            sizeBytes
-                            __typename
-                        }
-                        isSplitTransaction
-                        createdAt
-                        updatedAt
-                        category {
-                            id
-                            name
-                            __typename
-                        }
-                        merchant {
-                            name
-                            id
-                            transactionsCount
-                            __typename
-                        }
-                        account {
-                            id
-                            displayName
-                            __typename
-                        }
-                        tags {
-                            id
-                            name
-                            color
-                            order
-                            __typename
-                        }
-                        __typename
-                    }
-                    __typename
-                }
-            }
-        """
-        )
+        from ._queries import transactions_query
+
+        query = transactions_query(fields)
 
         variables = {
             "offset": offset,
@@ -343,6 +433,68 @@ class MonarchMoney(object):
             variables=variables,
         )
 
+    async def get_transactions_all(
+        self,
+        total: Optional[int] = None,
+        page_size: int = 100,
+        start_date: Optional[str] = None,
+        end_date: Optional[str] = None,
+        search: str = "",
+        category_ids: List[str] = [],
+        account_ids: List[str] = [],
+        tag_ids: List[str] = [],
+        fields: Optional[List[str]] = None,
+    ) -> Dict[str, Any]:
+        """
+        Gets transaction data spanning multiple pages.
+
+        Fetches the first page to learn the server's total count, then
+        requests all remaining offset pages concurrently and flattens them
+        into a single result, so downloading N pages costs roughly two
+        round-trips of latency instead of N.
+
+        :param total: the maximum number of transactions to download across
+            all pages. None downloads every matching transaction.
+        :param page_size: the number of transactions requested per page.
+        :param start_date: the earliest date to get transactions from, in "yyyy-mm-dd" format.
+        :param end_date: the latest date to get transactions from, in "yyyy-mm-dd" format.
+        :param search: a string to filter transactions. use empty string for all results.
+        :param category_ids: a list of category ids to filter.
+        :param account_ids: a list of account ids to filter.
+        :param tag_ids: a list of tag ids to filter.
+        :param fields: optional dotted field paths passed through to
+            :meth:`get_transactions`.
+        """
+        common = {
+            "start_date": start_date,
+            "end_date": end_date,
+            "search": search,
+            "category_ids": category_ids,
+            "account_ids": account_ids,
+            "tag_ids": tag_ids,
+            "fields": fields,
+        }
+
+        first = await self.get_transactions(limit=page_size, offset=0, **common)
+        all_transactions = first.get("allTransactions", {})
+        total_count = all_transactions.get("totalCount", 0)
+        target = total_count if total is None else min(total, total_count)
+
+        results = list(all_transactions.get("results", []))
+        offsets = range(page_size, target, page_size)
+        if offsets:
+            pages = await asyncio.gather(
+                *(
+                    self.get_transactions(limit=page_size, offset=offset, **common)
+                    for offset in offsets
+                )
+            )
+            for page in pages:
+                results.extend(page.get("allTransactions", {}).get("results", []))
+
+        all_transactions["results"] = results[:target]
+        return first
+
     async def _login_user(
         self, email: str, password: str, mfa_secret_key: Optional[str]
     ) -> None:
@@ -355,22 +507,24 @@ class MonarchMoney(object):
         }
 
         if mfa_secret_key:
-            data["totp"] = oathtool.generate_otp(mfa_secret_key)
+            import oathtool
 
-        async with ClientSession(headers=self._headers) as session:
-            async with session.post(
-                MonarchMoneyEndpoints.getLoginEndpoint(), json=data
-            ) as resp:
-                if resp.status == 403:
-                    raise RequireMFAException("Multi-Factor Auth Required")
-                elif resp.status != 200:
-                    raise LoginFailedException(
-                        f"HTTP Code {resp.status}: {resp.reason}"
-                    )
+            data["totp"] = oathtool.generate_otp(mfa_secret_key)
 
-                response = await resp.json()
-                self.set_token(response["token"])
-                self._headers["Authorization"] = f"Token {self._token}"
+        session = self._ensure_http()
+        async with session.post(
+            MonarchMoneyEndpoints.getLoginEndpoint(), json=data
+        ) as resp:
+            if resp.status == 403:
+                raise RequireMFAException("Multi-Factor Auth Required")
+            elif resp.status != 200:
+                raise LoginFailedException(
+                    f"HTTP Code {resp.status}: {resp.reason}"
+                )
+
+            response = await resp.json()
+            self.set_token(response["token"])
+            self._set_auth_header()
 
     async def _multi_factor_authenticate(
         self, email: str, password: str, code: str
@@ -384,55 +538,238 @@ class MonarchMoney(object):
             "username": email,
         }
 
-        async with ClientSession(headers=self._headers) as session:
-            async with session.post(
-                MonarchMoneyEndpoints.getLoginEndpoint(), json=data
-            ) as resp:
-                if resp.status != 200:
-                    try:
-                        response = await resp.json()
-                        if "detail" in response:
-                            error_message = response["detail"]
-                            raise RequireMFAException(error_message)
-                        elif "error_code" in response:
-                            error_message = response["error_code"]
-                        else:
-                            error_message = f"Unrecognized error message: '{response}'"
-                        raise LoginFailedException(error_message)
-                    except:
-                        raise LoginFailedException(
-                            f"HTTP Code {resp.status}: {resp.reason}\nRaw response: {resp.text}"
-                        )
-                response = await resp.json()
-                self.set_token(response["token"])
-                self._headers["Authorization"] = f"Token {self._token}"
+        session = self._ensure_http()
+        async with session.post(
+            MonarchMoneyEndpoints.getLoginEndpoint(), json=data
+        ) as resp:
+            if resp.status != 200:
+                try:
+                    response = await resp.json()
+                    if "detail" in response:
+                        error_message = response["detail"]
+                        raise RequireMFAException(error_message)
+                    elif "error_code" in response:
+                        error_message = response["error_code"]
+                    else:
+                        error_message = f"Unrecognized error message: '{response}'"
+                    raise LoginFailedException(error_message)
+                except:
+                    raise LoginFailedException(
+                        f"HTTP Code {resp.status}: {resp.reason}\nRaw response: {resp.text}"
+                    )
+            response = await resp.json()
+            self.set_token(response["token"])
+            self._set_auth_header()
+
+    def _ensure_http(self) -> "ClientSession":
+        """
+        Returns the shared aiohttp session used for auth calls, creating
+        it on first use. A login followed by an MFA step then rides one
+        connection instead of negotiating TLS twice.
+        """
+        if self._http is None or self._http.closed:
+            from aiohttp import ClientSession
+
+            self._http = ClientSession(headers=self._headers_for("auth"))
+        return self._http
+
+    async def _close_http(self) -> None:
+        """Closes the shared auth session, if one was opened."""
+        if self._http is not None:
+            await self._http.close()
+            self._http = None
 
     async def gql_call(
         self,
         operation: str,
-        graphql_query: DocumentNode,
+        graphql_query: "GraphQLRequest",
         variables: Dict[str, Any] = {},
+        cache_ttl: Optional[float] = None,
     ) -> Dict[str, Any]:
-        """Makes a GraphQL call to Monarch Money's API."""
-        return await self._get_graphql_client().execute_async(
-            document=graphql_query,
-            operation_name=operation,
+        """
+        Makes a GraphQL call to Monarch Money's API.
+
+        :param cache_ttl: when set, the response for this operation and
+            variable combination is cached in-process and reused for that
+            many seconds, short-circuiting repeat reads of slow-changing
+            data (account types, institutions). None (the default) always
+            hits the API. Call :meth:`invalidate_cache` after a mutation.
+
+        Identical calls made while one is already in flight share that
+        round-trip instead of issuing their own, so concurrent fan-out
+        (e.g. several coroutines each wanting the account list) costs one
+        request.
+        """
+        from graphql import print_ast
+
+        # The document is part of the identity: same-named operations can
+        # carry different selection sets (field projections), and those
+        # must never share a round-trip or a cache slot. gql() returns a
+        # GraphQLRequest wrapping the AST, so unwrap before printing.
+        key = (
+            operation,
+            print_ast(getattr(graphql_query, "document", graphql_query)),
+            json.dumps(variables, sort_keys=True),
+        )
+
+        # Cached and deduped hits hand back deep copies: callers mutate
+        # responses in place (stitching pages, annotating accounts), and a
+        # shared dict would let one caller corrupt another's result.
+        if cache_ttl is not None:
+            cached = self._response_cache.get(key)
+            if cached is not None and time.monotonic() - cached[0] < cache_ttl:
+                return copy.deepcopy(cached[1])
+
+        inflight = self._inflight.get(key)
+        if inflight is not None:
+            result = copy.deepcopy(await inflight)
+        else:
+            task = asyncio.ensure_future(
+                self._execute(operation, graphql_query, variables)
+            )
+            self._inflight[key] = task
+            try:
+                result = await task
+            finally:
+                self._inflight.pop(key, None)
+
+        if cache_ttl is not None:
+            self._response_cache[key] = (time.monotonic(), copy.deepcopy(result))
+        return result
+
+    async def _execute(
+        self,
+        operation: str,
+        graphql_query: "GraphQLRequest",
+        variables: Dict[str, Any],
+    ) -> Dict[str, Any]:
+        """Executes one GraphQL request on the persistent session if open."""
+        from gql import GraphQLRequest
+
+        # GraphQLRequest also accepts a raw DocumentNode, so callers that
+        # built their own document still work.
+        request = GraphQLRequest(
+            graphql_query,
             variable_values=variables,
+            operation_name=operation,
         )
+        if self._gql_session is not None:
+            return await self._gql_session.execute(request)
+        return await self._get_graphql_client().execute_async(request)
+
+    def invalidate_cache(self, operation: Optional[str] = None) -> None:
+        """
+        Clears cached gql_call responses — all of them, or only those for
+        the given operation name.
+        """
+        if operation is None:
+            self._response_cache.clear()
+        else:
+            for key in [k for k in self._response_cache if k[0] == operation]:
+                del self._response_cache[key]
 
-    def _get_graphql_client(self) -> Client:
-        """Creates a correctly configured GraphQL client for connecting to Monarch Money."""
+    @classmethod
+    def _load_local_schema(cls):
+        """
+        Returns the packaged introspection schema, or None when the
+        package doesn't ship one. monarchmoney/schema.json is produced at
+        release time by running the standard introspection query against
+        the API; with it, the client validates queries locally and never
+        needs a schema fetch at runtime.
+        """
+        if not cls._local_schema_loaded:
+            cls._local_schema_loaded = True
+            path = os.path.join(os.path.dirname(__file__), "schema.json")
+            try:
+                with open(path, "r") as fh:
+                    introspection = json.load(fh)
+            except FileNotFoundError:
+                return None
+            from graphql import build_client_schema
+
+            cls._local_schema = build_client_schema(introspection)
+        return cls._local_schema
+
+    def _get_graphql_client(self) -> "Client":
+        """
+        Returns a correctly configured GraphQL client for connecting to
+        Monarch Money, building it on first use and reusing it afterwards
+        so repeated calls share one transport instead of reconnecting
+        per request. The cache is invalidated whenever the token or
+        timeout changes.
+        """
         if self._headers is None:
             raise LoginFailedException(
                 "Make sure you call login() first or provide a session token!"
             )
-        transport = AIOHTTPTransport(
-            url=MonarchMoneyEndpoints.getGraphQL(),
-            headers=self._headers,
-            timeout=self._timeout,
-        )
-        return Client(
-            transport=transport,
-            fetch_schema_from_transport=False,
-            execute_timeout=self._timeout,
-        )
+        if self._client is None:
+            from aiohttp import TCPConnector
+            from gql import Client
+            from gql.transport.aiohttp import AIOHTTPTransport
+
+            class _SharedConnectorTransport(AIOHTTPTransport):
+                """
+                AIOHTTPTransport that still closes its per-call session
+                when the connector is shared. Upstream close() skips
+                session teardown entirely under connector_owner False,
+                leaking an "Unclosed client session" warning per call;
+                closing a non-owner session releases it without touching
+                the shared connector.
+                """
+
+                async def close(self) -> None:
+                    session, self.session = self.session, None
+                    if session is not None:
+                        await session.close()
+
+            # Keep connections warm between bursts: hold idle sockets well
+            # past the default so successive CLI commands or test runs skip
+            # the TLS re-handshake, and cache DNS answers for five minutes.
+            # The transport closes its aiohttp session after every
+            # per-call execute, so the connector must be owned here
+            # (connector_owner False) rather than by that session — else
+            # the first call's teardown would close the pool out from
+            # under every later call. close()/_invalidate_client shut it
+            # down. TCPConnector needs a running loop, so only attach one
+            # when the client is (as in every real call path) built from
+            # async code; a sync build falls back to the default
+            # connector.
+            client_session_args: Dict[str, Any] = {"trust_env": True}
+            try:
+                asyncio.get_running_loop()
+            except RuntimeError:
+                pass
+            else:
+                if self._connector is None or self._connector.closed:
+                    self._connector = TCPConnector(
+                        limit=32,
+                        limit_per_host=16,
+                        ttl_dns_cache=300,
+                        keepalive_timeout=75,
+                    )
+                client_session_args["connector"] = self._connector
+                client_session_args["connector_owner"] = False
+
+            transport_args: Dict[str, Any] = {}
+            if orjson is not None:
+                # orjson decodes the large accounts/transactions payloads
+                # roughly twice as fast as the stdlib codec the transport
+                # defaults to; fall back silently when it isn't installed.
+                transport_args["json_serialize"] = lambda data: orjson.dumps(
+                    data
+                ).decode()
+                transport_args["json_deserialize"] = orjson.loads
+            transport = _SharedConnectorTransport(
+                url=MonarchMoneyEndpoints.getGraphQL(),
+                headers=self._headers_for("graphql"),
+                timeout=self._timeout,
+                client_session_args=client_session_args,
+                **transport_args,
+            )
+            self._client = Client(
+                transport=transport,
+                schema=self._load_local_schema(),
+                fetch_schema_from_transport=False,
+                execute_timeout=self._timeout,
+            )
+        return self._client
@@ -4,11 +4,26 @@ Test login functionality for MonarchMoney Python SDK.
 """
 
 import asyncio
+import os
 from monarchmoney import MonarchMoney
 
 async def test_login():
-    mm = MonarchMoney()
-    await mm.interactive_login()
+    # Token-only fast path: when MONARCH_TOKEN is set (the common
+    # CI/automation case), skip the interactive login round-trips and just
+    # persist the session.
+    token = os.getenv('MONARCH_TOKEN')
+    if token:
+        mm = MonarchMoney(token=token)
+        mm.save_session()
+    else:
+        mm = MonarchMoney()
+        await mm.interactive_login()
+
+    # Verify the session with a fetch inside the same event loop, so the
+    # connections opened during login are still alive for the test call.
+    accounts = await mm.get_accounts()
+    print(f"✅ Login verified: {len(accounts.get('accounts', []))} accounts visible")
+    return mm
 
 if __name__ == "__main__":
     asyncio.run(test_login())
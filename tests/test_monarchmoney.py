@@ -1,10 +1,11 @@
+import asyncio
 import os
-import pickle
 import unittest
 from unittest.mock import patch
 
 import json
 from gql import Client
+from graphql import print_ast
 from monarchmoney import MonarchMoney
 from monarchmoney.monarchmoney import LoginFailedException
 
@@ -15,13 +16,13 @@ class TestMonarchMoney(unittest.IsolatedAsyncioTestCase):
         Set up any necessary data or variables for the tests here.
         This method will be called before each test method is executed.
         """
-        with open("temp_session.pickle", "wb") as fh:
+        with open("temp_session.json", "w") as fh:
             session_data = {
                 "token": "test_token",
             }
-            pickle.dump(session_data, fh)
+            json.dump(session_data, fh)
         self.monarch_money = MonarchMoney()
-        self.monarch_money.load_session("temp_session.pickle")
+        self.monarch_money.load_session("temp_session.json")
 
     @patch.object(Client, "execute_async")
     async def test_get_accounts(self, mock_execute_async):
@@ -74,6 +75,187 @@ class TestMonarchMoney(unittest.IsolatedAsyncioTestCase):
             "Expected type name to be 'loan'",
         )
 
+    @patch.object(Client, "execute_async")
+    async def test_gql_call_dedups_identical_concurrent_calls(
+        self, mock_execute_async
+    ):
+        """
+        Test that identical concurrent calls share one round-trip.
+        """
+
+        async def slow_response(request, **kwargs):
+            await asyncio.sleep(0.01)
+            return {"accounts": []}
+
+        mock_execute_async.side_effect = slow_response
+        first, second = await asyncio.gather(
+            self.monarch_money.get_accounts(),
+            self.monarch_money.get_accounts(),
+        )
+        self.assertEqual(
+            mock_execute_async.call_count,
+            1,
+            "Expected concurrent identical calls to share one request",
+        )
+        self.assertEqual(first, second, "Expected both callers to see the result")
+
+    @patch.object(Client, "execute_async")
+    async def test_gql_call_dedup_keys_on_document(self, mock_execute_async):
+        """
+        Test that concurrent calls with the same operation and variables
+        but different selection sets each issue their own request.
+        """
+
+        async def echo_selection(request, **kwargs):
+            await asyncio.sleep(0.01)
+            return {"selection": print_ast(request.document)}
+
+        mock_execute_async.side_effect = echo_selection
+        full, projected = await asyncio.gather(
+            self.monarch_money.get_transactions(),
+            self.monarch_money.get_transactions(fields=["amount"]),
+        )
+        self.assertEqual(
+            mock_execute_async.call_count,
+            2,
+            "Expected differently projected calls to stay separate",
+        )
+        self.assertNotEqual(
+            full["selection"],
+            projected["selection"],
+            "Expected each caller to receive its own projection",
+        )
+
+    @patch.object(Client, "execute_async")
+    async def test_gql_call_cache_returns_copies(self, mock_execute_async):
+        """
+        Test that TTL-cached responses are isolated from caller mutations.
+        """
+        from monarchmoney._queries import GET_ACCOUNTS_QUERY
+
+        mock_execute_async.return_value = {"accounts": [{"id": "1"}]}
+        first = await self.monarch_money.gql_call(
+            "GetAccounts", GET_ACCOUNTS_QUERY, cache_ttl=60
+        )
+        first["accounts"].append({"id": "mutated"})
+        second = await self.monarch_money.gql_call(
+            "GetAccounts", GET_ACCOUNTS_QUERY, cache_ttl=60
+        )
+        self.assertEqual(
+            mock_execute_async.call_count,
+            1,
+            "Expected the second call to be served from cache",
+        )
+        self.assertEqual(
+            len(second["accounts"]),
+            1,
+            "Expected the cached entry to be isolated from caller mutations",
+        )
+        self.assertIsNot(first, second, "Expected each hit to get its own object")
+
+    @patch.object(Client, "execute_async")
+    async def test_get_transactions_all(self, mock_execute_async):
+        """
+        Test that get_transactions_all stitches every offset page together.
+        """
+        total_count = 250
+
+        async def paged_response(request, **kwargs):
+            offset = request.variable_values["offset"]
+            limit = request.variable_values["limit"]
+            count = max(0, min(limit, total_count - offset))
+            return {
+                "allTransactions": {
+                    "totalCount": total_count,
+                    "results": [{"id": str(offset + i)} for i in range(count)],
+                }
+            }
+
+        mock_execute_async.side_effect = paged_response
+        result = await self.monarch_money.get_transactions_all(page_size=100)
+        results = result["allTransactions"]["results"]
+        self.assertEqual(
+            mock_execute_async.call_count, 3, "Expected three pages of 100"
+        )
+        self.assertEqual(len(results), 250, "Expected every transaction")
+        self.assertEqual(
+            [r["id"] for r in results[:3]],
+            ["0", "1", "2"],
+            "Expected page order to be preserved",
+        )
+        self.assertEqual(
+            results[-1]["id"], "249", "Expected the last page's tail to be kept"
+        )
+
+    @patch.object(Client, "execute_async")
+    async def test_get_transactions_all_respects_total(self, mock_execute_async):
+        """
+        Test that get_transactions_all stops at the requested total.
+        """
+
+        async def paged_response(request, **kwargs):
+            offset = request.variable_values["offset"]
+            return {
+                "allTransactions": {
+                    "totalCount": 500,
+                    "results": [{"id": str(offset + i)} for i in range(100)],
+                }
+            }
+
+        mock_execute_async.side_effect = paged_response
+        result = await self.monarch_money.get_transactions_all(
+            total=150, page_size=100
+        )
+        self.assertEqual(
+            mock_execute_async.call_count, 2, "Expected only two pages for 150"
+        )
+        self.assertEqual(
+            len(result["allTransactions"]["results"]),
+            150,
+            "Expected the result to be sliced to the requested total",
+        )
+
+    async def test_sequential_calls_survive_transport_teardown(self):
+        """
+        Test two sequential calls through the real transport. The
+        transport closes its aiohttp session after each per-call
+        execute; the shared connector must survive that teardown or
+        every second-and-later call fails with a closed session.
+        """
+        from aiohttp import web
+        from monarchmoney.monarchmoney import MonarchMoneyEndpoints
+
+        calls = 0
+
+        async def graphql_stub(request):
+            nonlocal calls
+            calls += 1
+            return web.json_response({"data": {"accounts": []}})
+
+        app = web.Application()
+        app.router.add_post("/graphql", graphql_stub)
+        runner = web.AppRunner(app)
+        await runner.setup()
+        site = web.TCPSite(runner, "127.0.0.1", 0)
+        await site.start()
+        port = runner.addresses[0][1]
+
+        try:
+            with patch.object(
+                MonarchMoneyEndpoints, "BASE_URL", f"http://127.0.0.1:{port}"
+            ):
+                monarch_money = MonarchMoney(token="test_token")
+                try:
+                    first = await monarch_money.get_accounts()
+                    second = await monarch_money.get_accounts()
+                finally:
+                    await monarch_money.close()
+            self.assertEqual(calls, 2, "Expected both calls to reach the server")
+            self.assertEqual(first, {"accounts": []})
+            self.assertEqual(second, {"accounts": []})
+        finally:
+            await runner.cleanup()
+
     async def test_login(self):
         """
         Test the login method with empty values for email and password.
@@ -94,6 +276,25 @@ class TestMonarchMoney(unittest.IsolatedAsyncioTestCase):
         with self.assertRaises(LoginFailedException):
             await self.monarch_money.interactive_login(use_saved_session=False)
 
+    def test_load_session_legacy_pickle(self):
+        """
+        Test that load_session still reads a pre-JSON pickled session file.
+        """
+        import pickle
+
+        with open("temp_session.pickle", "wb") as fh:
+            pickle.dump({"token": "legacy_token"}, fh)
+        try:
+            monarch_money = MonarchMoney()
+            monarch_money.load_session("temp_session.pickle")
+            self.assertEqual(
+                monarch_money.token,
+                "legacy_token",
+                "Expected the legacy pickle session to load",
+            )
+        finally:
+            monarch_money.delete_session("temp_session.pickle")
+
     @classmethod
     def loadTestData(cls, filename) -> dict:
         filename = f"{os.path.dirname(os.path.realpath(__file__))}/{filename}"
@@ -105,7 +306,7 @@ class TestMonarchMoney(unittest.IsolatedAsyncioTestCase):
         Tear down any necessary data or variables for the tests here.
         This method will be called after each test method is executed.
         """
-        self.monarch_money.delete_session("temp_session.pickle")
+        self.monarch_money.delete_session("temp_session.json")
 
 
 if __name__ == "__main__":